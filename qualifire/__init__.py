@@ -2,7 +2,18 @@
 
 import logging
 
-from . import client, consts, tracer_init, types, utils
+from . import (
+    client,
+    consts,
+    guardrails,
+    results,
+    routing,
+    scheduler,
+    tracer_init,
+    types,
+    utils,
+    windowing,
+)
 from .tracer_init import init
 
 logger = logging.getLogger("qualifire")
@@ -22,6 +33,7 @@ version: str = get_version()
 
 __all__ = [
     "client",
+    "guardrails",
     "types",
     "init",
     "version",
@@ -0,0 +1,336 @@
+"""Bulk evaluation of JSONL/CSV datasets: ``python -m qualifire``."""
+
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import argparse
+import csv
+import inspect
+import json
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from .client import Client
+from .types import (
+    ConversationWindow,
+    EvaluationResponse,
+    LLMMessage,
+    LLMToolDefinition,
+    Priority,
+)
+from .windowing import apply_conversation_window
+
+logger = logging.getLogger("qualifire")
+
+_RECORD_FIELDS = ("input", "output", "messages", "available_tools", "metadata")
+# record fields stored as JSON in CSV cells
+_JSON_FIELDS = ("messages", "available_tools", "metadata")
+# the boolean checks of Client.evaluate that can be enabled with --check
+CHECKS = tuple(
+    name
+    for name, parameter in inspect.signature(Client.evaluate).parameters.items()
+    if parameter.default is False
+    and (name.endswith("_check") or name == "prompt_injections")
+)
+
+
+def read_records(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily read dataset records from a JSONL or CSV file.
+
+    CSV cells holding ``messages``, ``available_tools`` or ``metadata`` are
+    parsed as JSON.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            for row in csv.DictReader(f):
+                record: Dict[str, Any] = {k: v for k, v in row.items() if v}
+                for key in _JSON_FIELDS:
+                    if key in record:
+                        record[key] = json.loads(record[key])
+                yield record
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class Checkpoint:
+    """
+    Tracks which records were written to the results file.
+
+    ``next_index`` is the first record not yet written and ``done`` holds the
+    indices after it that finished out of order, so its size is bounded by the
+    concurrency. ``offset`` is the results file size at the time of the last
+    save; on resume the file is truncated to it so no result is duplicated.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.next_index = 0
+        self.done: Set[int] = set()
+        self.offset = 0
+
+    @classmethod
+    def load(cls, path: str) -> Optional["Checkpoint"]:
+        if not os.path.exists(path):
+            return None
+        checkpoint = cls(path)
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        checkpoint.next_index = state["next_index"]
+        checkpoint.done = set(state["done"])
+        checkpoint.offset = state["offset"]
+        return checkpoint
+
+    def is_done(self, index: int) -> bool:
+        return index < self.next_index or index in self.done
+
+    def mark_done(self, index: int, offset: int) -> None:
+        self.done.add(index)
+        while self.next_index in self.done:
+            self.done.remove(self.next_index)
+            self.next_index += 1
+        self.offset = offset
+
+    def save(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "next_index": self.next_index,
+                    "done": sorted(self.done),
+                    "offset": self.offset,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.path)
+
+
+def _evaluate_record(
+    client: Client,
+    record: Dict[str, Any],
+    evaluation_id: Optional[str],
+    checks: Dict[str, Any],
+    conversation_window: Optional[ConversationWindow],
+) -> Optional[EvaluationResponse]:
+    kwargs = {key: record[key] for key in _RECORD_FIELDS if record.get(key)}
+    if "available_tools" in kwargs:
+        kwargs["available_tools"] = [
+            tool if isinstance(tool, LLMToolDefinition) else LLMToolDefinition(**tool)
+            for tool in kwargs["available_tools"]
+        ]
+    if evaluation_id:
+        return client.invoke_evaluation(
+            evaluation_id=evaluation_id,
+            conversation_window=conversation_window,
+            priority=Priority.BACKGROUND,
+            **kwargs,
+        )
+    if "messages" in kwargs:
+        messages = kwargs["messages"]
+        if conversation_window is not None:
+            # window the raw dicts so dropped messages are never validated
+            messages = apply_conversation_window(messages, conversation_window)
+        kwargs["messages"] = [
+            message if isinstance(message, LLMMessage) else LLMMessage(**message)
+            for message in messages
+        ]
+    return client.evaluate(
+        priority=Priority.BACKGROUND,
+        **checks,
+        **kwargs,
+    )
+
+
+def _write_result(
+    out: IO[bytes],
+    index: int,
+    record: Dict[str, Any],
+    future: "Future[Optional[EvaluationResponse]]",
+) -> bool:
+    entry: Dict[str, Any] = {"index": index}
+    if "id" in record:
+        entry["id"] = record["id"]
+    try:
+        result = future.result()
+        entry["result"] = result.model_dump(mode="json") if result else None
+        ok = True
+    except Exception as e:
+        entry["error"] = str(e)
+        ok = False
+    out.write(json.dumps(entry).encode("utf-8") + b"\n")
+    out.flush()
+    return ok
+
+
+def run(
+    client: Client,
+    dataset: str,
+    output: str,
+    checkpoint_path: Optional[str] = None,
+    concurrency: int = 8,
+    evaluation_id: Optional[str] = None,
+    checks: Sequence[str] = (),
+    conversation_window: Optional[ConversationWindow] = None,
+) -> Tuple[int, int]:
+    """
+    Evaluate every record of a dataset and write the results as JSONL.
+
+    Records are streamed and at most ``2 * concurrency`` of them are held in
+    memory at once. Each result line holds the record ``index`` (and ``id``
+    when present) with either the evaluation ``result`` or an ``error``. If a
+    checkpoint from a previous run exists, records already written are skipped
+    and new results are appended.
+
+    :param client: The Qualifire client used for evaluations.
+    :param dataset: Path of the JSONL or CSV dataset.
+    :param output: Path of the JSONL results file.
+    :param checkpoint_path: Path of the checkpoint file.
+        Defaults to ``<output>.checkpoint``, which is removed on completion.
+    :param concurrency: Number of evaluations running in parallel.
+    :param evaluation_id: Run this pre-configured evaluation with
+        ``invoke_evaluation`` instead of ``evaluate``.
+    :param checks: Names of the ``evaluate`` boolean checks to enable.
+    :param conversation_window: Optional window applied to record messages.
+    :return: The number of succeeded and failed records of this run.
+    """
+    unknown_checks = sorted(set(checks) - set(CHECKS))
+    if unknown_checks:
+        raise ValueError(f"Unknown checks: {', '.join(unknown_checks)}")
+
+    checkpoint_path = checkpoint_path or f"{output}.checkpoint"
+    checkpoint = Checkpoint.load(checkpoint_path)
+    if checkpoint is not None and not os.path.exists(output):
+        logger.warning("Results file %s is missing, starting over", output)
+        checkpoint = None
+    if checkpoint is None:
+        checkpoint = Checkpoint(checkpoint_path)
+        mode = "wb"
+    else:
+        logger.info("Resuming from record %d", checkpoint.next_index)
+        mode = "r+b"
+
+    check_kwargs = {check: True for check in checks}
+    succeeded = failed = 0
+    pending: Dict[
+        "Future[Optional[EvaluationResponse]]",
+        Tuple[int, Dict[str, Any]],
+    ] = {}
+
+    with open(output, mode) as out, ThreadPoolExecutor(
+        max_workers=concurrency,
+    ) as executor:
+        out.seek(checkpoint.offset)
+        out.truncate()
+        checkpoint.save()
+
+        def drain(max_pending: int) -> None:
+            nonlocal succeeded, failed
+            while len(pending) > max_pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, record = pending.pop(future)
+                    if _write_result(out, index, record, future):
+                        succeeded += 1
+                    else:
+                        failed += 1
+                    checkpoint.mark_done(index, out.tell())
+                checkpoint.save()
+
+        for index, record in enumerate(read_records(dataset)):
+            if checkpoint.is_done(index):
+                continue
+            future = executor.submit(
+                _evaluate_record,
+                client,
+                record,
+                evaluation_id,
+                check_kwargs,
+                conversation_window,
+            )
+            pending[future] = (index, record)
+            drain(2 * concurrency - 1)
+        drain(0)
+
+    os.remove(checkpoint_path)
+    return succeeded, failed
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m qualifire",
+        description="Evaluate a JSONL or CSV dataset of input/output/messages "
+        "records and write the results as JSONL.",
+    )
+    parser.add_argument("dataset", help="Path of the JSONL or CSV dataset.")
+    parser.add_argument(
+        "-o",
+        "--output",
+        required=True,
+        help="Path of the JSONL results file.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="Path of the checkpoint file (default: <output>.checkpoint).",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Number of evaluations running in parallel (default: 8).",
+    )
+    parser.add_argument(
+        "--evaluation-id",
+        help="Run a pre-configured evaluation instead of individual checks.",
+    )
+    parser.add_argument(
+        "--check",
+        action="append",
+        default=[],
+        dest="checks",
+        choices=CHECKS,
+        metavar="CHECK",
+        help="Enable an evaluate check, e.g. --check prompt_injections. "
+        f"May be repeated. One of: {', '.join(CHECKS)}.",
+    )
+    parser.add_argument("--max-turns", type=int, help="Window record messages.")
+    parser.add_argument("--max-tokens", type=int, help="Window record messages.")
+    parser.add_argument("--api-key", help="Defaults to QUALIFIRE_API_KEY.")
+    parser.add_argument("--base-url", help="Defaults to QUALIFIRE_BASE_URL.")
+    args = parser.parse_args(argv)
+    if not args.evaluation_id and not args.checks:
+        parser.error("one of --evaluation-id or --check is required")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be positive")
+    if args.max_turns is not None and args.max_turns < 1:
+        parser.error("--max-turns must be positive")
+    if args.max_tokens is not None and args.max_tokens < 1:
+        parser.error("--max-tokens must be positive")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    conversation_window = None
+    if args.max_turns is not None or args.max_tokens is not None:
+        conversation_window = ConversationWindow(
+            max_turns=args.max_turns,
+            max_tokens=args.max_tokens,
+        )
+
+    succeeded, failed = run(
+        Client(api_key=args.api_key, base_url=args.base_url),
+        args.dataset,
+        args.output,
+        checkpoint_path=args.checkpoint,
+        concurrency=args.concurrency,
+        evaluation_id=args.evaluation_id,
+        checks=args.checks,
+        conversation_window=conversation_window,
+    )
+    logger.info("Evaluated %d records, %d failed", succeeded + failed, failed)
+    return 1 if failed else 0
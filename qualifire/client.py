@@ -1,11 +1,17 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, ContextManager, Dict, List, Optional, Tuple, Union
 
 import logging
+import time
+from contextlib import nullcontext
 
 import requests
 
+from .routing import EndpointRouter
+from .scheduler import RequestScheduler
 from .types import (
     CompilePromptResponse,
+    ConversationWindow,
+    EndpointStats,
     EvaluationInvokeRequest,
     EvaluationRequest,
     EvaluationResponse,
@@ -13,9 +19,12 @@ from .types import (
     LLMToolDefinition,
     ModelMode,
     PolicyTarget,
+    Priority,
+    QueueMetrics,
     SyntaxCheckArgs,
 )
-from .utils import get_api_key, get_base_url
+from .utils import get_api_key, get_base_urls, parse_base_urls
+from .windowing import apply_conversation_window
 
 logger = logging.getLogger("qualifire")
 
@@ -24,16 +33,28 @@ class Client:
     def __init__(
         self,
         api_key: Optional[str],
-        base_url: Optional[str] = None,
+        base_url: Optional[Union[str, List[str]]] = None,
         version: Optional[str] = None,
         debug: bool = False,
         verify: bool = True,
+        max_concurrency: Optional[int] = None,
+        reserved_realtime: Optional[int] = None,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
     ) -> None:
-        self._base_url = base_url or get_base_url()
+        if isinstance(base_url, str):
+            base_url = parse_base_urls(base_url)
+        self._router = EndpointRouter(base_url or get_base_urls())
         self._api_key = api_key or get_api_key()
         self._version = version
         self._debug = debug
         self._verify = verify
+        self._timeout = timeout
+        self._scheduler = None
+        if max_concurrency:
+            if reserved_realtime is None:
+                # reserve one slot when there is room to leave one for background
+                reserved_realtime = min(1, max_concurrency - 1)
+            self._scheduler = RequestScheduler(max_concurrency, reserved_realtime)
 
     def evaluate(
         self,
@@ -68,6 +89,8 @@ class Client:
         topic_scoping_target: PolicyTarget = PolicyTarget.BOTH,
         allowed_topics: Optional[List[str]] = None,
         metadata: Optional[Dict[str, str]] = None,
+        conversation_window: Optional[ConversationWindow] = None,
+        priority: Priority = Priority.REALTIME,
     ) -> Union[EvaluationResponse, None]:
         """
         Evaluates the given input and output pairs.
@@ -115,6 +138,10 @@ class Client:
         :param topic_scoping_target: Target topic for topic scoping check.
         :param allowed_topics: List of allowed topics for topic scoping check.
         :param metadata: Optional dictionary of string key-value pairs to attach to the evaluation invocation.
+        :param conversation_window: Optional policy bounding the `messages` history sent
+            with the evaluation (system prompt, last N turns and/or a token budget).
+        :param priority: Scheduling class of the request when the client was created
+            with `max_concurrency`. Realtime requests start before queued background ones.
 
         :return: An EvaluationResponse object containing the evaluation results.
         :raises Exception: If an error occurs during the evaluation.
@@ -207,7 +234,9 @@ class Client:
         )
         ```
         """  # noqa E501
-        url = f"{self._base_url}/api/v1/evaluation/evaluate"
+        if messages and conversation_window is not None:
+            messages = apply_conversation_window(messages, conversation_window)
+
         request = EvaluationRequest(
             input=input,
             output=output,
@@ -241,11 +270,10 @@ class Client:
             metadata=metadata,
         )
 
-        response = requests.post(
-            url,
-            headers=self._get_headers(),
-            json=request.model_dump(),
-            verify=self._verify,
+        response = self._post(
+            "/api/v1/evaluation/evaluate",
+            request.model_dump(),
+            priority,
         )
 
         if response.status_code != 200:
@@ -268,8 +296,12 @@ class Client:
         ] = None,
         available_tools: Optional[List[LLMToolDefinition]] = None,
         metadata: Optional[Dict[str, str]] = None,
+        conversation_window: Optional[ConversationWindow] = None,
+        priority: Priority = Priority.REALTIME,
     ) -> EvaluationResponse:
-        url = f"{self._base_url}/api/v1/evaluation/invoke/"
+        if messages and conversation_window is not None:
+            # window before converting so only the kept dicts are validated
+            messages = apply_conversation_window(messages, conversation_window)  # type: ignore # noqa E501
 
         if messages is not None:
             if isinstance(messages, list) and all(
@@ -286,12 +318,10 @@ class Client:
             metadata=metadata,
         )
 
-        response = requests.request(
-            "POST",
-            url,
-            json=request.model_dump(),
-            headers=self._get_headers(),
-            verify=self._verify,
+        response = self._post(
+            "/api/v1/evaluation/invoke/",
+            request.model_dump(),
+            priority,
         )
         if response.status_code != 200:
             if self._debug:
@@ -309,20 +339,16 @@ class Client:
         prompt_id: str,
         revision_id: Optional[str] = None,
         params: Optional[Dict[str, str]] = None,
+        priority: Priority = Priority.REALTIME,
     ) -> CompilePromptResponse:
-        url = f"{self._base_url}/api/v1/studio/prompts/{prompt_id}/compile"
+        path = f"/api/v1/studio/prompts/{prompt_id}/compile"
         if revision_id:
-            url = f"{url}?revision={revision_id}"
+            path = f"{path}?revision={revision_id}"
 
         if not params:
             params = {}
 
-        response = requests.post(
-            url=url,
-            json={"variables": params},
-            headers=self._get_headers(),
-            verify=self._verify,
-        )
+        response = self._post(path, {"variables": params}, priority)
 
         if response.status_code != 200:
             message = f"Qualifire API error: {response.status_code}"
@@ -332,6 +358,80 @@ class Client:
 
         return CompilePromptResponse(**response.json())
 
+    def scheduler_metrics(self) -> Dict[Priority, QueueMetrics]:
+        """
+        Per-priority queue metrics of the request scheduler.
+
+        :return: Metrics per priority class, empty if the client was created
+            without `max_concurrency`.
+        """
+        if self._scheduler is None:
+            return {}
+        return self._scheduler.metrics()
+
+    def endpoint_stats(self) -> List[EndpointStats]:
+        """
+        Latency and health of the configured API endpoints.
+
+        :return: The latency EWMA, error rate and health of each endpoint.
+        """
+        return self._router.stats()
+
+    def _post(
+        self,
+        path: str,
+        json: Dict[str, Any],
+        priority: Priority,
+    ) -> requests.Response:
+        with self._slot(priority):
+            # fastest healthy endpoint first, fail over on connection errors and 5xx.
+            # A read timeout is not retried: the server may still be evaluating,
+            # it only marks the endpoint unhealthy for the following requests.
+            *fallbacks, last = self._router.order()
+            for base_url in fallbacks:
+                try:
+                    response = self._post_to(base_url, path, json)
+                except requests.ConnectionError:
+                    logger.warning("Qualifire endpoint %s is unreachable", base_url)
+                    continue
+                if response.status_code < 500:
+                    return response
+                logger.warning(
+                    "Qualifire endpoint %s returned %d",
+                    base_url,
+                    response.status_code,
+                )
+            return self._post_to(last, path, json)
+
+    def _post_to(
+        self,
+        base_url: str,
+        path: str,
+        json: Dict[str, Any],
+    ) -> requests.Response:
+        started = time.monotonic()
+        try:
+            response = requests.post(
+                f"{base_url}{path}",
+                headers=self._get_headers(),
+                json=json,
+                verify=self._verify,
+                timeout=self._timeout,
+            )
+        except (requests.ConnectionError, requests.Timeout):
+            self._router.record_failure(base_url)
+            raise
+        if response.status_code >= 500:
+            self._router.record_failure(base_url)
+        else:
+            self._router.record_success(base_url, time.monotonic() - started)
+        return response
+
+    def _slot(self, priority: Priority) -> ContextManager[None]:
+        if self._scheduler is None:
+            return nullcontext()
+        return self._scheduler.slot(priority)
+
     def _get_headers(self) -> Dict[str, Any]:
         return {
             "X-Qualifire-API-Key": self._api_key,
@@ -0,0 +1,208 @@
+from typing import Any, Callable, Dict, Optional
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .client import Client
+from .types import EvaluationResponse, Priority
+
+logger = logging.getLogger("qualifire")
+
+
+class InputFlaggedError(Exception):
+    """Raised when the input of a guarded chat completion is flagged."""
+
+    def __init__(self, evaluation: EvaluationResponse) -> None:
+        super().__init__(
+            f"Qualifire flagged the input (score: {evaluation.score})",
+        )
+        self.evaluation = evaluation
+
+
+def _is_flagged(evaluation: EvaluationResponse) -> bool:
+    return any(
+        result.flagged
+        for item in evaluation.evaluationResults
+        for result in item.results
+    )
+
+
+def _message_text(message: Any) -> Optional[str]:
+    content = (
+        message.get("content")
+        if isinstance(message, dict)
+        else getattr(message, "content", None)
+    )
+    if content is None or isinstance(content, str):
+        return content
+    # OpenAI content parts, e.g. [{"type": "text", "text": "..."}]
+    return "\n".join(
+        part.get("text", "")
+        for part in content
+        if isinstance(part, dict) and part.get("type") == "text"
+    )
+
+
+def _last_user_input(messages: Any) -> Optional[str]:
+    for message in reversed(list(messages or [])):
+        role = (
+            message.get("role")
+            if isinstance(message, dict)
+            else getattr(message, "role", None)
+        )
+        if role == "user":
+            return _message_text(message)
+    return None
+
+
+def _completion_text(completion: Any) -> Optional[str]:
+    choices = getattr(completion, "choices", None)
+    if not choices:
+        return None
+    return getattr(choices[0].message, "content", None)
+
+
+class GuardedChatCompletions:
+    """
+    Runs Qualifire input checks concurrently with an OpenAI-compatible
+    ``chat.completions.create`` call.
+
+    The model call runs on its own thread while the input is evaluated on the
+    caller's thread, so a request costs roughly ``max(evaluation, completion)``
+    instead of their sum and input checks never queue behind other work. If the
+    input is flagged, :class:`InputFlaggedError` is raised as soon as the
+    evaluation returns and the completion is discarded. Output checks, when
+    configured, run with background priority on a separate thread pool after
+    the completion is returned.
+
+    :param client: The Qualifire client used for evaluations.
+    :param llm_client: An OpenAI-compatible client exposing
+        ``chat.completions.create``.
+    :param input_checks: Keyword arguments forwarded to :meth:`Client.evaluate`
+        for the input evaluation. Defaults to ``{"prompt_injections": True}``.
+    :param output_checks: Keyword arguments forwarded to :meth:`Client.evaluate`
+        for the output evaluation. Output is not evaluated when unset.
+    :param on_output_evaluation: Called with the completion and its
+        EvaluationResponse once the output evaluation finishes.
+    :param max_workers: Size of the thread pool running output evaluations.
+
+    Example:
+
+    ```python
+    from openai import OpenAI
+    from qualifire.client import Client
+    from qualifire.guardrails import GuardedChatCompletions, InputFlaggedError
+
+    guarded = GuardedChatCompletions(
+        Client(api_key="your_api_key"),
+        OpenAI(),
+        output_checks={"hallucinations_check": True},
+    )
+
+    try:
+        completion = guarded.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": "Hello!"}],
+        )
+    except InputFlaggedError as e:
+        print(e.evaluation)
+    ```
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        llm_client: Any,
+        input_checks: Optional[Dict[str, Any]] = None,
+        output_checks: Optional[Dict[str, Any]] = None,
+        on_output_evaluation: Optional[
+            Callable[[Any, EvaluationResponse], None]
+        ] = None,
+        max_workers: int = 8,
+    ) -> None:
+        self._client = client
+        self._llm_client = llm_client
+        self._input_checks = (
+            input_checks if input_checks is not None else {"prompt_injections": True}
+        )
+        self._output_checks = output_checks
+        self._on_output_evaluation = on_output_evaluation
+        self._output_executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="qualifire-guardrails",
+        )
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def create(self, **kwargs: Any) -> Any:
+        """
+        Create a chat completion guarded by the configured input checks.
+
+        :param kwargs: Arguments forwarded to ``chat.completions.create``.
+        :return: The completion returned by the LLM client.
+        :raises InputFlaggedError: If the input evaluation flags the request.
+        :raises RuntimeError: If the wrapper was closed.
+        """
+        if self._closed:
+            raise RuntimeError("GuardedChatCompletions is closed")
+        user_input = _last_user_input(kwargs.get("messages"))
+        completion_future: "Future[Any]" = Future()
+        threading.Thread(
+            target=self._complete,
+            args=(completion_future, kwargs),
+            name="qualifire-guardrails-completion",
+            daemon=True,
+        ).start()
+
+        if user_input:
+            evaluation = self._client.evaluate(input=user_input, **self._input_checks)
+            if evaluation is not None and _is_flagged(evaluation):
+                # a running request cannot be interrupted, its result is discarded
+                raise InputFlaggedError(evaluation)
+
+        completion = completion_future.result()
+        if self._output_checks is not None:
+            with self._lock:
+                # closed while the completion was running, skip output checks
+                if not self._closed:
+                    self._output_executor.submit(
+                        self._evaluate_output,
+                        user_input,
+                        completion,
+                    )
+        return completion
+
+    def close(self) -> None:
+        """Wait for pending output evaluations and release the thread pool."""
+        with self._lock:
+            self._closed = True
+        self._output_executor.shutdown(wait=True)
+
+    def _complete(self, future: "Future[Any]", kwargs: Dict[str, Any]) -> None:
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(self._llm_client.chat.completions.create(**kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    def _evaluate_output(self, user_input: Optional[str], completion: Any) -> None:
+        output = _completion_text(completion)
+        if not output:
+            return
+        try:
+            evaluation = self._client.evaluate(
+                input=user_input,
+                output=output,
+                priority=Priority.BACKGROUND,
+                **(self._output_checks or {}),
+            )
+        except Exception:
+            logger.exception("Qualifire output evaluation failed")
+            return
+        if evaluation is None or self._on_output_evaluation is None:
+            return
+        try:
+            self._on_output_evaluation(completion, evaluation)
+        except Exception:
+            logger.exception("Qualifire on_output_evaluation callback failed")
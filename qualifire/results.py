@@ -0,0 +1,328 @@
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import json
+from array import array
+
+try:
+    import numpy as np
+
+    numpy_installed = True
+except ImportError:
+    numpy_installed = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    pyarrow_installed = True
+except ImportError:
+    pyarrow_installed = False
+
+from .types import EvaluationResponse
+
+_NUMERIC_COLUMNS = ("evaluation", "score", "confidence_score", "flagged")
+_STRING_COLUMNS = ("type", "name", "label")
+COLUMNS = _NUMERIC_COLUMNS + _STRING_COLUMNS
+
+
+class _StringColumn:
+    """Dictionary-encoded strings: one code per row, each value stored once."""
+
+    def __init__(self) -> None:
+        self.codes = array("I")
+        self.values: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def find(self, value: str) -> Optional[int]:
+        return self._index.get(value)
+
+    def append(self, value: str) -> None:
+        self.codes.append(self.code(value))
+
+    def with_codes(self, codes: "array[int]") -> "_StringColumn":
+        column = _StringColumn()
+        column.values = list(self.values)
+        column._index = dict(self._index)
+        column.codes = codes
+        return column
+
+
+class ResultStore:
+    """
+    Columnar storage for large numbers of evaluation results.
+
+    Each EvaluationResult is stored as one row of compact arrays: ``evaluation``
+    (the position of its EvaluationResponse in the store), ``score``,
+    ``confidence_score``, ``flagged``, and the dictionary-encoded ``type``,
+    ``name`` and ``label`` strings. Free-text fields (claim, quote, reason) are
+    not kept. Responses can be appended as raw API JSON without building any
+    pydantic objects.
+
+    Filtering and aggregation are vectorized with NumPy when it is installed.
+    Arrow/Parquet export requires pyarrow.
+
+    >>> store = ResultStore()
+    >>> store.append({"score": 50, "status": "completed", "evaluationResults": [
+    ...     {"type": "pii", "results": [
+    ...         {"name": "pii", "label": "EMAIL", "score": 0,
+    ...          "confidence_score": 95.0, "flagged": True},
+    ...         {"name": "pii", "label": "SAFE", "score": 100,
+    ...          "confidence_score": 90.0, "flagged": False},
+    ...     ]},
+    ... ]})
+    >>> len(store), store.flagged_count()
+    (2, 1)
+    >>> store.filter(flagged=True).column("label")
+    ['EMAIL']
+    """
+
+    def __init__(self) -> None:
+        self._evaluations = 0
+        self._evaluation = array("q")
+        self._score = array("i")
+        self._confidence_score = array("d")
+        self._flagged = array("B")
+        self._strings = {name: _StringColumn() for name in _STRING_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self._score)
+
+    @property
+    def evaluation_count(self) -> int:
+        return self._evaluations
+
+    def append(self, evaluation: Union[EvaluationResponse, Dict[str, Any]]) -> None:
+        """
+        Append the results of one evaluation.
+
+        All results are read and converted before any column is changed, so an
+        invalid evaluation leaves the store untouched.
+
+        :param evaluation: An EvaluationResponse or its raw JSON dict.
+        """
+        if isinstance(evaluation, EvaluationResponse):
+            evaluation = evaluation.model_dump()
+        rows = [
+            (item["type"], result)
+            for item in evaluation["evaluationResults"]
+            for result in item["results"]
+        ]
+        score = array("i", (result["score"] for _, result in rows))
+        confidence_score = array(
+            "d",
+            (result["confidence_score"] for _, result in rows),
+        )
+        flagged = array("B", (bool(result["flagged"]) for _, result in rows))
+        strings = {
+            "type": [type_ for type_, _ in rows],
+            "name": [result["name"] for _, result in rows],
+            "label": [result["label"] for _, result in rows],
+        }
+        for name, values in strings.items():
+            if not all(isinstance(value, str) for value in values):
+                raise TypeError(f"Result {name} must be a string")
+
+        self._evaluation.extend(array("q", [self._evaluations]) * len(rows))
+        self._score.extend(score)
+        self._confidence_score.extend(confidence_score)
+        self._flagged.extend(flagged)
+        for name, values in strings.items():
+            column = self._strings[name]
+            column.codes.extend(array("I", (column.code(value) for value in values)))
+        self._evaluations += 1
+
+    def extend(
+        self,
+        evaluations: Iterable[Union[EvaluationResponse, Dict[str, Any]]],
+    ) -> None:
+        for evaluation in evaluations:
+            self.append(evaluation)
+
+    @classmethod
+    def from_jsonl(cls, path: str) -> "ResultStore":
+        """
+        Load a results file written by the ``python -m qualifire`` CLI.
+
+        Lines holding an error instead of a result are skipped.
+        """
+        store = cls()
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry.get("result"):
+                    store.append(entry["result"])
+        return store
+
+    def column(self, name: str) -> Union["array[Any]", List[str]]:
+        """
+        Return a column by name.
+
+        :param name: One of ``COLUMNS``.
+        :return: A copy of a numeric column, or the decoded values of a string
+            column.
+        """
+        if name in self._strings:
+            column = self._strings[name]
+            return [column.values[code] for code in column.codes]
+        if name not in _NUMERIC_COLUMNS:
+            raise ValueError(f"Unknown column: {name}")
+        data = self._array(name)
+        return array(data.typecode, data)
+
+    def filter(
+        self,
+        flagged: Optional[bool] = None,
+        type: Optional[str] = None,
+        name: Optional[str] = None,
+        label: Optional[str] = None,
+        min_score: Optional[int] = None,
+        max_score: Optional[int] = None,
+    ) -> "ResultStore":
+        """Return a new store with the rows matching all given conditions."""
+        conditions = (("type", type), ("name", name), ("label", label))
+        codes = {
+            column_name: self._strings[column_name].find(value)
+            for column_name, value in conditions
+            if value is not None
+        }
+        if None in codes.values():
+            # a value never seen matches no row
+            return self._take([])
+
+        if numpy_installed:
+            mask = np.ones(len(self), dtype=bool)
+            if flagged is not None:
+                mask &= self._numpy_column("flagged") == flagged
+            if min_score is not None:
+                mask &= self._numpy_column("score") >= min_score
+            if max_score is not None:
+                mask &= self._numpy_column("score") <= max_score
+            for column_name, code in codes.items():
+                mask &= self._numpy_column(column_name) == code
+            return self._take(np.flatnonzero(mask))
+
+        return self._take(
+            [
+                i
+                for i in range(len(self))
+                if (flagged is None or bool(self._flagged[i]) == flagged)
+                and (min_score is None or self._score[i] >= min_score)
+                and (max_score is None or self._score[i] <= max_score)
+                and all(
+                    self._strings[column_name].codes[i] == code
+                    for column_name, code in codes.items()
+                )
+            ],
+        )
+
+    def flagged_count(self) -> int:
+        if numpy_installed:
+            return int(self._numpy_column("flagged").sum())
+        return sum(self._flagged)
+
+    def mean(self, name: str) -> float:
+        """Return the mean of a numeric column, ``nan`` for an empty store."""
+        if name not in ("score", "confidence_score", "flagged"):
+            raise ValueError(f"Cannot average column: {name}")
+        if not len(self):
+            return float("nan")
+        if numpy_installed:
+            return float(self._numpy_column(name).mean())
+        return float(sum(self._array(name))) / len(self)
+
+    def count_by(self, name: str) -> Dict[str, int]:
+        """Return the number of rows per value of a string column."""
+        if name not in self._strings:
+            raise ValueError(f"Cannot group by column: {name}")
+        column = self._strings[name]
+        counts: Any
+        if numpy_installed:
+            counts = np.bincount(
+                self._numpy_column(name),
+                minlength=len(column.values),
+            )
+        else:
+            counts = [0] * len(column.values)
+            for code in column.codes:
+                counts[code] += 1
+        return {
+            value: int(count) for value, count in zip(column.values, counts) if count
+        }
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Return the columns as NumPy arrays.
+
+        The arrays are copies, so they stay valid while the store grows. String
+        columns are decoded to object arrays.
+        """
+        if not numpy_installed:
+            raise RuntimeError("ResultStore.to_numpy requires numpy")
+        columns = {
+            name: np.array(self._numpy_column(name), copy=True)
+            for name in _NUMERIC_COLUMNS
+        }
+        columns["flagged"] = columns["flagged"].astype(bool)
+        for name, column in self._strings.items():
+            values = np.array(column.values, dtype=object)
+            columns[name] = values[self._numpy_column(name)]
+        return columns
+
+    def to_arrow(self) -> Any:
+        """Return the store as a ``pyarrow.Table`` with dictionary string columns."""
+        if not pyarrow_installed:
+            raise RuntimeError("ResultStore.to_arrow requires pyarrow")
+        columns = {
+            "evaluation": pa.array(self._evaluation, type=pa.int64()),
+            "score": pa.array(self._score, type=pa.int32()),
+            "confidence_score": pa.array(self._confidence_score, type=pa.float64()),
+            "flagged": pa.array(
+                (bool(flagged) for flagged in self._flagged),
+                type=pa.bool_(),
+            ),
+        }
+        for name, column in self._strings.items():
+            columns[name] = pa.DictionaryArray.from_arrays(
+                pa.array(column.codes, type=pa.uint32()),
+                pa.array(column.values, type=pa.string()),
+            )
+        return pa.table(columns)
+
+    def to_parquet(self, path: str) -> None:
+        pq.write_table(self.to_arrow(), path)
+
+    def _array(self, name: str) -> "array[Any]":
+        if name in self._strings:
+            return self._strings[name].codes
+        return getattr(self, f"_{name}")  # type: ignore[no-any-return]
+
+    def _numpy_column(self, name: str) -> Any:
+        # a zero-copy view: it must not outlive the calling method, since the
+        # backing array cannot grow while a view is exported
+        data = self._array(name)
+        return np.frombuffer(data, dtype=np.dtype(data.typecode))
+
+    def _take(self, indices: Any) -> "ResultStore":
+        store = ResultStore()
+        store._evaluations = self._evaluations
+        if numpy_installed:
+            indices = np.asarray(indices, dtype=np.intp)
+        for name in COLUMNS:
+            source = self._array(name)
+            if numpy_installed:
+                selected = self._numpy_column(name)[indices]
+                taken = array(source.typecode, selected.tobytes())
+            else:
+                taken = array(source.typecode, (source[i] for i in indices))
+            if name in self._strings:
+                store._strings[name] = self._strings[name].with_codes(taken)
+            else:
+                setattr(store, f"_{name}", taken)
+        return store
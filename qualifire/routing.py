@@ -0,0 +1,82 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import threading
+import time
+
+from .types import EndpointStats
+
+
+class EndpointRouter:
+    """
+    Orders API endpoints by observed latency and health.
+
+    Each endpoint keeps an exponentially weighted moving average (EWMA) of its
+    request latency and error rate. A failed endpoint is skipped for
+    ``failure_cooldown`` seconds, after which it is tried again. Endpoints with
+    no latency sample yet are tried first so every endpoint gets measured.
+
+    :param urls: The base URLs of the endpoints.
+    :param alpha: Weight of the newest sample in the moving averages.
+    :param failure_cooldown: Seconds an endpoint is considered unhealthy after
+        a failure.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        alpha: float = 0.2,
+        failure_cooldown: float = 30.0,
+    ) -> None:
+        if not urls:
+            raise ValueError("At least one endpoint URL must be set")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self._urls = list(urls)
+        self._alpha = alpha
+        self._failure_cooldown = failure_cooldown
+        self._lock = threading.Lock()
+        self._latency: Dict[str, Optional[float]] = {url: None for url in urls}
+        self._error_rate = {url: 0.0 for url in urls}
+        self._unhealthy_until = {url: 0.0 for url in urls}
+
+    def order(self) -> List[str]:
+        """Return the endpoints to try, best first; unhealthy ones come last."""
+        now = time.monotonic()
+
+        def rank(url: str) -> Tuple[float, float]:
+            if self._unhealthy_until[url] > now:
+                return (float("inf"), self._unhealthy_until[url])
+            return (self._latency[url] or 0.0, 0.0)
+
+        with self._lock:
+            return sorted(self._urls, key=rank)
+
+    def record_success(self, url: str, latency: float) -> None:
+        with self._lock:
+            previous = self._latency[url]
+            self._latency[url] = (
+                latency
+                if previous is None
+                else self._alpha * latency + (1 - self._alpha) * previous
+            )
+            self._error_rate[url] *= 1 - self._alpha
+            self._unhealthy_until[url] = 0.0
+
+    def record_failure(self, url: str) -> None:
+        with self._lock:
+            self._error_rate[url] *= 1 - self._alpha
+            self._error_rate[url] += self._alpha
+            self._unhealthy_until[url] = time.monotonic() + self._failure_cooldown
+
+    def stats(self) -> List[EndpointStats]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                EndpointStats(
+                    url=url,
+                    latency_ewma=self._latency[url],
+                    error_rate=self._error_rate[url],
+                    healthy=self._unhealthy_until[url] <= now,
+                )
+                for url in self._urls
+            ]
@@ -0,0 +1,85 @@
+from typing import Dict, Iterator
+
+import threading
+import time
+from contextlib import contextmanager
+
+from .types import Priority, QueueMetrics
+
+
+class RequestScheduler:
+    """
+    Bounds the number of concurrent API requests per priority class.
+
+    Up to ``max_concurrency`` requests run at once, of which
+    ``reserved_realtime`` slots are only available to realtime requests.
+    Queued realtime requests always start before queued background requests.
+
+    :param max_concurrency: Maximum number of requests in flight.
+    :param reserved_realtime: Slots background requests may never use. Must be
+        lower than ``max_concurrency`` so background requests can still run.
+    """
+
+    def __init__(self, max_concurrency: int, reserved_realtime: int = 1) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+        if not 0 <= reserved_realtime < max_concurrency:
+            raise ValueError(
+                "reserved_realtime must be between 0 and max_concurrency - 1",
+            )
+        self._max_concurrency = max_concurrency
+        self._reserved_realtime = reserved_realtime
+        self._condition = threading.Condition()
+        self._queued = {priority: 0 for priority in Priority}
+        self._in_flight = {priority: 0 for priority in Priority}
+        self._completed = {priority: 0 for priority in Priority}
+        self._total_wait = {priority: 0.0 for priority in Priority}
+        self._max_wait = {priority: 0.0 for priority in Priority}
+
+    @contextmanager
+    def slot(self, priority: Priority) -> Iterator[None]:
+        """Block until a request of the given priority may start."""
+        queued_at = time.monotonic()
+        with self._condition:
+            self._queued[priority] += 1
+            try:
+                self._condition.wait_for(lambda: self._can_start(priority))
+            finally:
+                self._queued[priority] -= 1
+                if priority == Priority.REALTIME:
+                    # background waiters held back by this request may now start
+                    self._condition.notify_all()
+            self._in_flight[priority] += 1
+            waited = time.monotonic() - queued_at
+            self._total_wait[priority] += waited
+            self._max_wait[priority] = max(self._max_wait[priority], waited)
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight[priority] -= 1
+                self._completed[priority] += 1
+                self._condition.notify_all()
+
+    def metrics(self) -> Dict[Priority, QueueMetrics]:
+        with self._condition:
+            return {
+                priority: QueueMetrics(
+                    queued=self._queued[priority],
+                    in_flight=self._in_flight[priority],
+                    completed=self._completed[priority],
+                    total_wait_seconds=self._total_wait[priority],
+                    max_wait_seconds=self._max_wait[priority],
+                )
+                for priority in Priority
+            }
+
+    def _can_start(self, priority: Priority) -> bool:
+        in_flight = sum(self._in_flight.values())
+        if priority == Priority.REALTIME:
+            return in_flight < self._max_concurrency
+        return (
+            self._queued[Priority.REALTIME] == 0
+            and in_flight < self._max_concurrency - self._reserved_realtime
+        )
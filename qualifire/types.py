@@ -17,6 +17,11 @@ class PolicyTarget(str, Enum):
     BOTH = "both"
 
 
+class Priority(str, Enum):
+    REALTIME = "realtime"
+    BACKGROUND = "background"
+
+
 class LLMToolDefinition(BaseModel):
     name: str
     description: str
@@ -39,6 +44,30 @@ class SyntaxCheckArgs(BaseModel):
     args: str
 
 
+class ConversationWindow(BaseModel):
+    """
+    Bounds the conversation history sent with multi-turn evaluations.
+
+    Leading system messages are always kept. The most recent turns are kept up
+    to ``max_turns`` user turns and an estimated ``max_tokens`` budget, and an
+    assistant message with tool calls is never separated from its tool results.
+    """
+
+    max_turns: Optional[int] = None
+    max_tokens: Optional[int] = None
+    keep_system_prompt: bool = True
+
+    @model_validator(mode="after")
+    def validate_model(self) -> "ConversationWindow":
+        if self.max_turns is None and self.max_tokens is None:
+            raise ValueError("At least one of max_turns or max_tokens must be set")
+        if self.max_turns is not None and self.max_turns < 1:
+            raise ValueError("max_turns must be positive")
+        if self.max_tokens is not None and self.max_tokens < 1:
+            raise ValueError("max_tokens must be positive")
+        return self
+
+
 class EvaluationRequest(BaseModel):
     input: Optional[str] = None
     output: Optional[str] = None
@@ -167,3 +196,18 @@ class CompilePromptResponse(BaseModel):
     messages: List[LLMMessage]
     tools: List[ToolResponse]
     parameters: Dict[str, Any]
+
+
+class QueueMetrics(BaseModel):
+    queued: int
+    in_flight: int
+    completed: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+class EndpointStats(BaseModel):
+    url: str
+    latency_ewma: Optional[float] = None
+    error_rate: float = 0.0
+    healthy: bool = True
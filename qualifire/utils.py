@@ -1,3 +1,5 @@
+from typing import List
+
 import os
 
 from .consts import (
@@ -23,6 +25,14 @@ def get_base_url() -> str:
     return base_url
 
 
+def parse_base_urls(base_url: str) -> List[str]:
+    return [url.strip() for url in base_url.split(",") if url.strip()]
+
+
+def get_base_urls() -> List[str]:
+    return parse_base_urls(get_base_url())
+
+
 def get_tracing_url() -> str:
     tracing_url = os.getenv(QUALIFIRE_TRACING_URL_ENV_VAR)
     if not tracing_url:
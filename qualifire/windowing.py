@@ -0,0 +1,79 @@
+from typing import Any, List, Sequence, TypeVar
+
+from .types import ConversationWindow
+
+M = TypeVar("M")
+
+_SYSTEM_ROLES = ("system", "developer")
+# Rough per-message overhead of the chat format, in tokens.
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def _get(message: Any, key: str) -> Any:
+    if isinstance(message, dict):
+        return message.get(key)
+    return getattr(message, key, None)
+
+
+def estimate_tokens(message: Any) -> int:
+    """
+    Estimate the token count of a message using ~4 characters per token.
+
+    >>> estimate_tokens({"role": "user", "content": "What is the capital of France?"})
+    11
+    """
+    content = _get(message, "content")
+    size = len(content) if isinstance(content, str) else len(str(content or ""))
+    tool_calls = _get(message, "tool_calls")
+    if tool_calls:
+        size += len(str(tool_calls))
+    return _MESSAGE_OVERHEAD_TOKENS + size // 4
+
+
+def apply_conversation_window(
+    messages: Sequence[M],
+    window: ConversationWindow,
+) -> List[M]:
+    """
+    Trim a conversation history to the given window.
+
+    Messages are only sliced, never copied or re-validated, so this works on
+    both LLMMessage objects and raw OpenAI-style dicts.
+
+    :param messages: The conversation history, oldest message first.
+    :param window: The windowing policy to apply.
+    :return: The leading system messages followed by the most recent messages
+        that fit the window. The latest message is always kept.
+    """
+    head = 0
+    if window.keep_system_prompt:
+        while head < len(messages) and _get(messages[head], "role") in _SYSTEM_ROLES:
+            head += 1
+
+    budget = window.max_tokens
+    if budget is not None:
+        budget -= sum(estimate_tokens(message) for message in messages[:head])
+
+    used = 0
+    turns = 0
+    start = end = len(messages)
+    while start > head:
+        # tool results are kept together with the assistant message calling them
+        block_start = start - 1
+        while block_start > head and _get(messages[block_start], "role") == "tool":
+            block_start -= 1
+
+        if window.max_turns is not None and turns >= window.max_turns:
+            break
+        block_tokens = sum(
+            estimate_tokens(message) for message in messages[block_start:start]
+        )
+        if budget is not None and start < end and used + block_tokens > budget:
+            break
+
+        used += block_tokens
+        if _get(messages[block_start], "role") == "user":
+            turns += 1
+        start = block_start
+
+    return list(messages[:head]) + list(messages[start:])
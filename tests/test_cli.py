@@ -0,0 +1,224 @@
+from typing import Any, Dict, List, cast
+
+import json
+
+import pytest
+
+from qualifire.cli import main, run
+from qualifire.client import Client
+from qualifire.types import (
+    ConversationWindow,
+    EvaluationRequest,
+    EvaluationResponse,
+    LLMMessage,
+    LLMToolDefinition,
+    Priority,
+)
+
+_response = EvaluationResponse(score=100, status="completed", evaluationResults=[])
+
+
+class Crash(BaseException):
+    pass
+
+
+class FakeClient:
+    def __init__(self, crash_on=None):
+        self.crash_on = crash_on
+        self.calls: List[Dict[str, Any]] = []
+
+    def evaluate(self, **kwargs):
+        if self.crash_on is not None and kwargs.get("input") == self.crash_on:
+            raise Crash()
+        if kwargs.get("input") == "bad":
+            raise Exception("Qualifire API error: 400")
+        self.calls.append(kwargs)
+        return _response
+
+    def invoke_evaluation(self, **kwargs):
+        self.calls.append(kwargs)
+        return _response
+
+
+def _write_dataset(tmp_path, inputs):
+    dataset = tmp_path / "dataset.jsonl"
+    dataset.write_text(
+        "".join(json.dumps({"id": i, "input": text}) + "\n" for i, text in inputs),
+    )
+    return str(dataset)
+
+
+def _client(fake):
+    return cast(Client, fake)
+
+
+def _read_results(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_run_writes_results_and_errors(tmp_path):
+    dataset = _write_dataset(tmp_path, [("a", "hello"), ("b", "bad")])
+    output = str(tmp_path / "results.jsonl")
+    client = FakeClient()
+
+    assert run(_client(client), dataset, output, checks=["prompt_injections"]) == (1, 1)
+
+    results = sorted(_read_results(output), key=lambda entry: entry["index"])
+    assert results[0]["id"] == "a" and results[0]["result"]["score"] == 100
+    assert results[1]["error"] == "Qualifire API error: 400"
+    assert client.calls[0]["prompt_injections"] is True
+    assert not (tmp_path / "results.jsonl.checkpoint").exists()
+
+
+def test_run_resumes_from_checkpoint(tmp_path):
+    inputs = [(str(i), f"input {i}") for i in range(10)]
+    dataset = _write_dataset(tmp_path, inputs)
+    output = str(tmp_path / "results.jsonl")
+
+    with pytest.raises(Crash):
+        run(_client(FakeClient(crash_on="input 6")), dataset, output, concurrency=1)
+    assert (tmp_path / "results.jsonl.checkpoint").exists()
+
+    client = FakeClient()
+    succeeded, failed = run(_client(client), dataset, output, concurrency=3)
+
+    assert failed == 0
+    assert succeeded == len(client.calls) < 10
+    assert "input 6" in [call["input"] for call in client.calls]
+    assert sorted(entry["index"] for entry in _read_results(output)) == list(
+        range(10),
+    )
+
+
+def test_run_restarts_when_results_file_is_missing(tmp_path):
+    dataset = _write_dataset(tmp_path, [("a", "hello"), ("b", "world")])
+    output = tmp_path / "results.jsonl"
+    (tmp_path / "results.jsonl.checkpoint").write_text(
+        json.dumps({"next_index": 1, "done": [], "offset": 100}),
+    )
+
+    assert run(_client(FakeClient()), dataset, str(output)) == (2, 0)
+    assert sorted(entry["index"] for entry in _read_results(output)) == [0, 1]
+
+
+def test_run_windows_messages_before_validating(tmp_path):
+    dataset = tmp_path / "dataset.jsonl"
+    messages = [
+        {"role": "user", "content": None},  # invalid, but dropped by the window
+        {"role": "assistant", "content": "Hello!"},
+        {"role": "user", "content": "Weather in Paris?"},
+    ]
+    dataset.write_text(json.dumps({"messages": messages}) + "\n")
+    client = FakeClient()
+
+    assert run(
+        _client(client),
+        str(dataset),
+        str(tmp_path / "out.jsonl"),
+        checks=["pii_check"],
+        conversation_window=ConversationWindow(max_turns=1),
+    ) == (1, 0)
+    assert client.calls[0]["messages"] == [LLMMessage.model_validate(messages[-1])]
+
+
+def test_run_csv_with_evaluation_id(tmp_path):
+    dataset = tmp_path / "dataset.csv"
+    dataset.write_text(
+        "input,output,messages\n"
+        'hi,hello,"[{""role"": ""user"", ""content"": ""hi""}]"\n',
+    )
+    client = FakeClient()
+
+    run(
+        _client(client),
+        str(dataset),
+        str(tmp_path / "out.jsonl"),
+        evaluation_id="eval_1",
+    )
+
+    assert client.calls == [
+        {
+            "evaluation_id": "eval_1",
+            "conversation_window": None,
+            "priority": Priority.BACKGROUND,
+            "input": "hi",
+            "output": "hello",
+            "messages": [{"role": "user", "content": "hi"}],
+        },
+    ]
+
+
+def test_run_with_available_tools(tmp_path):
+    dataset = tmp_path / "dataset.jsonl"
+    tool = {"name": "get_weather", "description": "Get weather", "parameters": {}}
+    dataset.write_text(
+        json.dumps(
+            {
+                "messages": [{"role": "user", "content": "Weather in Paris?"}],
+                "available_tools": [tool],
+            },
+        )
+        + "\n",
+    )
+    client = FakeClient()
+
+    assert run(
+        _client(client),
+        str(dataset),
+        str(tmp_path / "out.jsonl"),
+        checks=["tool_use_quality_check"],
+    ) == (1, 0)
+
+    call = client.calls[0]
+    assert call["available_tools"] == [LLMToolDefinition.model_validate(tool)]
+    EvaluationRequest(
+        messages=call["messages"],
+        available_tools=call["available_tools"],
+        tool_use_quality_check=call["tool_use_quality_check"],
+    )
+
+
+def test_main_requires_checks_or_evaluation_id(tmp_path):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "dataset.jsonl"), "-o", str(tmp_path / "out.jsonl")])
+
+
+@pytest.mark.parametrize("content", ["", "input,output\n"])
+def test_run_empty_dataset(tmp_path, content):
+    dataset = tmp_path / ("dataset.csv" if content else "dataset.jsonl")
+    dataset.write_text(content)
+    output = str(tmp_path / "results.jsonl")
+    client = _client(FakeClient())
+
+    assert run(client, str(dataset), output, checks=["pii_check"]) == (0, 0)
+    assert _read_results(output) == []
+    assert not (tmp_path / "results.jsonl.checkpoint").exists()
+
+
+def test_run_rejects_unknown_checks(tmp_path):
+    dataset = _write_dataset(tmp_path, [("a", "hello")])
+
+    with pytest.raises(ValueError, match="prompt_injection"):
+        run(
+            _client(FakeClient()),
+            dataset,
+            str(tmp_path / "out.jsonl"),
+            checks=["prompt_injection"],
+        )
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--check", "prompt_injection"],
+        ["--check", "messages"],
+        ["--check", "pii_check", "--max-turns", "0"],
+        ["--check", "pii_check", "--max-tokens", "0"],
+    ],
+)
+def test_main_rejects_invalid_arguments(tmp_path, args):
+    paths = [str(tmp_path / "dataset.jsonl"), "-o", str(tmp_path / "out.jsonl")]
+
+    with pytest.raises(SystemExit):
+        main(paths + args)
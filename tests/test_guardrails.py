@@ -0,0 +1,200 @@
+from types import SimpleNamespace
+from typing import Any, Dict, List, cast
+
+import threading
+import time
+
+import pytest
+
+from qualifire.client import Client
+from qualifire.guardrails import GuardedChatCompletions, InputFlaggedError
+from qualifire.types import EvaluationResponse, Priority
+
+
+def _evaluation(flagged: bool) -> EvaluationResponse:
+    return EvaluationResponse.model_validate(
+        {
+            "score": 0 if flagged else 100,
+            "status": "completed",
+            "evaluationResults": [
+                {
+                    "type": "prompt_injections",
+                    "results": [
+                        {
+                            "name": "prompt_injections",
+                            "label": "INJECTION" if flagged else "BENIGN",
+                            "quote": "",
+                            "reason": "",
+                            "score": 0 if flagged else 100,
+                            "confidence_score": 99,
+                            "flagged": flagged,
+                        },
+                    ],
+                },
+            ],
+        },
+    )
+
+
+class FakeQualifire:
+    def __init__(
+        self,
+        flagged: bool = False,
+        delay: float = 0.0,
+        output_delay: float = 0.0,
+    ) -> None:
+        self.flagged = flagged
+        self.delay = delay
+        self.output_delay = output_delay
+        self.calls: List[Dict[str, Any]] = []
+
+    def evaluate(self, **kwargs):
+        self.calls.append(kwargs)
+        time.sleep(self.output_delay if "output" in kwargs else self.delay)
+        return _evaluation(self.flagged)
+
+
+def _client(fake: FakeQualifire) -> Client:
+    return cast(Client, fake)
+
+
+class FakeOpenAI:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.finished = threading.Event()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):
+        time.sleep(self.delay)
+        self.finished.set()
+        message = SimpleNamespace(role="assistant", content="Hi there!")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+_messages = [
+    {"role": "system", "content": "You are a helpful assistant."},
+    {"role": "user", "content": [{"type": "text", "text": "Hello!"}]},
+]
+
+
+def test_returns_completion_when_input_is_clean():
+    qualifire = FakeQualifire()
+    guarded = GuardedChatCompletions(_client(qualifire), FakeOpenAI())
+
+    completion = guarded.create(model="gpt-4o-mini", messages=_messages)
+
+    assert completion.choices[0].message.content == "Hi there!"
+    assert qualifire.calls == [{"input": "Hello!", "prompt_injections": True}]
+
+
+def test_runs_evaluation_and_completion_concurrently():
+    guarded = GuardedChatCompletions(
+        _client(FakeQualifire(delay=0.2)),
+        FakeOpenAI(delay=0.2),
+    )
+
+    start = time.monotonic()
+    guarded.create(model="gpt-4o-mini", messages=_messages)
+
+    assert time.monotonic() - start < 0.35
+
+
+def test_raises_before_completion_finishes_when_input_is_flagged():
+    llm = FakeOpenAI(delay=0.5)
+    guarded = GuardedChatCompletions(_client(FakeQualifire(flagged=True)), llm)
+
+    with pytest.raises(InputFlaggedError) as exc_info:
+        guarded.create(model="gpt-4o-mini", messages=_messages)
+
+    assert not llm.finished.is_set()
+    assert exc_info.value.evaluation.score == 0
+
+
+def test_evaluates_output_in_background():
+    qualifire = FakeQualifire()
+    evaluated = []
+    guarded = GuardedChatCompletions(
+        _client(qualifire),
+        FakeOpenAI(),
+        input_checks={"pii_check": True},
+        output_checks={"hallucinations_check": True},
+        on_output_evaluation=lambda completion, evaluation: evaluated.append(
+            evaluation,
+        ),
+    )
+
+    guarded.create(model="gpt-4o-mini", messages=_messages)
+    guarded.close()
+
+    assert len(evaluated) == 1
+    assert {
+        "input": "Hello!",
+        "output": "Hi there!",
+        "priority": Priority.BACKGROUND,
+        "hallucinations_check": True,
+    } in qualifire.calls
+
+
+def test_input_checks_do_not_queue_behind_output_evaluations():
+    guarded = GuardedChatCompletions(
+        _client(FakeQualifire(output_delay=0.5)),
+        FakeOpenAI(),
+        output_checks={"hallucinations_check": True},
+        max_workers=1,
+    )
+
+    start = time.monotonic()
+    for _ in range(3):
+        guarded.create(model="gpt-4o-mini", messages=_messages)
+
+    assert time.monotonic() - start < 0.3
+    guarded.close()
+
+
+def test_logs_output_evaluation_callback_errors(caplog):
+    def on_output_evaluation(completion, evaluation):
+        raise ValueError("callback failed")
+
+    guarded = GuardedChatCompletions(
+        _client(FakeQualifire()),
+        FakeOpenAI(),
+        output_checks={"hallucinations_check": True},
+        on_output_evaluation=on_output_evaluation,
+    )
+
+    guarded.create(model="gpt-4o-mini", messages=_messages)
+    guarded.close()
+
+    assert "on_output_evaluation callback failed" in caplog.text
+    assert "callback failed" in caplog.text
+
+
+def test_create_after_close_raises():
+    llm = FakeOpenAI()
+    guarded = GuardedChatCompletions(
+        _client(FakeQualifire()),
+        llm,
+        output_checks={"hallucinations_check": True},
+    )
+    guarded.close()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        guarded.create(model="gpt-4o-mini", messages=_messages)
+    assert not llm.finished.is_set()
+
+
+def test_skips_output_evaluation_when_closed_during_create():
+    qualifire = FakeQualifire()
+    guarded = GuardedChatCompletions(
+        _client(qualifire),
+        FakeOpenAI(delay=0.2),
+        output_checks={"hallucinations_check": True},
+    )
+
+    closer = threading.Timer(0.1, guarded.close)
+    closer.start()
+    completion = guarded.create(model="gpt-4o-mini", messages=_messages)
+    closer.join()
+
+    assert completion.choices[0].message.content == "Hi there!"
+    assert all("output" not in call for call in qualifire.calls)
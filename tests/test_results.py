@@ -0,0 +1,160 @@
+import json
+import math
+
+import pytest
+
+from qualifire import results
+from qualifire.results import ResultStore
+from qualifire.types import EvaluationResponse
+
+
+def _result(label, score, flagged, name="check"):
+    return {
+        "name": name,
+        "label": label,
+        "quote": "",
+        "reason": "",
+        "score": score,
+        "confidence_score": 90.0,
+        "flagged": flagged,
+    }
+
+
+_evaluations = [
+    {
+        "score": 50,
+        "status": "completed",
+        "evaluationResults": [
+            {
+                "type": "pii",
+                "results": [_result("EMAIL", 0, True), _result("SAFE", 100, False)],
+            },
+            {"type": "prompt_injections", "results": [_result("BENIGN", 100, False)]},
+        ],
+    },
+    {
+        "score": 0,
+        "status": "completed",
+        "evaluationResults": [
+            {"type": "prompt_injections", "results": [_result("INJECTION", 0, True)]},
+        ],
+    },
+]
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure-python"])
+def store(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(results, "numpy_installed", request.param)
+    store = ResultStore()
+    store.append(EvaluationResponse.model_validate(_evaluations[0]))
+    store.append(_evaluations[1])
+    return store
+
+
+def test_append(store):
+    assert len(store) == 4
+    assert store.evaluation_count == 2
+    assert list(store.column("evaluation")) == [0, 0, 0, 1]
+    assert list(store.column("score")) == [0, 100, 100, 0]
+    assert store.column("type") == ["pii"] * 2 + ["prompt_injections"] * 2
+
+
+@pytest.mark.parametrize(
+    "conditions,expected_labels",
+    [
+        ({}, ["EMAIL", "SAFE", "BENIGN", "INJECTION"]),
+        ({"flagged": True}, ["EMAIL", "INJECTION"]),
+        ({"type": "prompt_injections"}, ["BENIGN", "INJECTION"]),
+        ({"type": "pii", "flagged": False}, ["SAFE"]),
+        ({"min_score": 50}, ["SAFE", "BENIGN"]),
+        ({"max_score": 50, "type": "pii"}, ["EMAIL"]),
+        ({"label": "unknown"}, []),
+    ],
+)
+def test_filter(store, conditions, expected_labels):
+    assert store.filter(**conditions).column("label") == expected_labels
+
+
+def test_aggregations(store):
+    assert store.flagged_count() == 2
+    assert store.mean("score") == 50
+    assert store.count_by("type") == {"pii": 2, "prompt_injections": 2}
+    assert store.filter(flagged=True).count_by("label") == {
+        "EMAIL": 1,
+        "INJECTION": 1,
+    }
+    assert math.isnan(store.filter(label="unknown").mean("score"))
+
+
+def test_from_jsonl(tmp_path):
+    path = tmp_path / "results.jsonl"
+    path.write_text(
+        json.dumps({"index": 0, "result": _evaluations[0]})
+        + "\n"
+        + json.dumps({"index": 1, "error": "Qualifire API error: 500"})
+        + "\n",
+    )
+
+    store = ResultStore.from_jsonl(str(path))
+
+    assert len(store) == 3
+    assert store.evaluation_count == 1
+
+
+def test_invalid_append_leaves_store_unchanged(store):
+    invalid = {
+        "score": 0,
+        "status": "completed",
+        "evaluationResults": [
+            {"type": "pii", "results": [_result("EMAIL", 0, True), {"score": 0}]},
+        ],
+    }
+
+    with pytest.raises(KeyError):
+        store.append(invalid)
+
+    assert len(store) == 4
+    assert store.evaluation_count == 2
+    assert {len(store.column(name)) for name in results.COLUMNS} == {4}
+
+
+def test_column_is_a_copy(store):
+    store.column("score")[0] = 42
+
+    assert store.column("score")[0] == 0
+
+
+def test_to_numpy(store):
+    np = pytest.importorskip("numpy")
+    if not results.numpy_installed:
+        with pytest.raises(RuntimeError):
+            store.to_numpy()
+        return
+
+    columns = store.to_numpy()
+
+    assert columns["flagged"].dtype == np.bool_
+    assert columns["label"].tolist() == ["EMAIL", "SAFE", "BENIGN", "INJECTION"]
+
+    store.append(_evaluations[1])
+
+    assert len(store) == 5
+    assert columns["score"].tolist() == [0, 100, 100, 0]
+
+
+def test_to_parquet(store, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "results.parquet")
+
+    store.to_parquet(path)
+
+    table = pq.read_table(path)
+    assert table.column("flagged").to_pylist() == [True, False, False, True]
+    assert table.column("type").to_pylist() == [
+        "pii",
+        "pii",
+        "prompt_injections",
+        "prompt_injections",
+    ]
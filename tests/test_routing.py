@@ -0,0 +1,151 @@
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from qualifire.client import Client
+from qualifire.routing import EndpointRouter
+
+_response = {"score": 100, "status": "completed", "evaluationResults": []}
+
+
+class StandInServer:
+    """A local stand-in for the Qualifire API answering evaluate requests."""
+
+    def __init__(self, status=200, delay=0.0):
+        self.status = status
+        self.delay = delay
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                server.requests += 1
+                time.sleep(server.delay)
+                body = json.dumps(_response).encode()
+                self.send_response(server.status)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def servers():
+    started = []
+
+    def start(**kwargs):
+        server = StandInServer(**kwargs)
+        started.append(server)
+        return server
+
+    yield start
+    for server in started:
+        server.close()
+
+
+def _unused_url():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}"
+
+
+def _evaluate(client):
+    return client.evaluate(input="hello", prompt_injections=True)
+
+
+def test_fails_over_on_connection_error_and_5xx(servers):
+    failing = servers(status=503)
+    healthy = servers()
+    client = Client(api_key="key", base_url=[_unused_url(), failing.url, healthy.url])
+
+    assert _evaluate(client).score == 100
+    assert _evaluate(client).score == 100
+
+    assert failing.requests == 1
+    assert healthy.requests == 2
+    stats = client.endpoint_stats()
+    assert [endpoint.healthy for endpoint in stats] == [False, False, True]
+    assert stats[1].error_rate > 0
+
+
+def test_routes_to_fastest_endpoint(servers):
+    slow = servers(delay=0.1)
+    fast = servers()
+    client = Client(api_key="key", base_url=[slow.url, fast.url])
+
+    for _ in range(5):
+        _evaluate(client)
+
+    assert slow.requests == 1
+    assert fast.requests == 4
+
+
+def test_read_timeout_is_raised_and_endpoint_avoided(servers):
+    hanging = servers(delay=1.0)
+    healthy = servers()
+    client = Client(
+        api_key="key",
+        base_url=[hanging.url, healthy.url],
+        timeout=(1.0, 0.2),
+    )
+
+    start = time.monotonic()
+    with pytest.raises(requests.ReadTimeout):
+        _evaluate(client)
+    assert time.monotonic() - start < 0.8
+    assert hanging.requests == 1
+    assert healthy.requests == 0
+
+    assert _evaluate(client).score == 100
+    assert hanging.requests == 1
+    assert healthy.requests == 1
+    assert [endpoint.healthy for endpoint in client.endpoint_stats()] == [False, True]
+
+
+def test_comma_separated_base_url(servers):
+    healthy = servers()
+    client = Client(api_key="key", base_url=f"{_unused_url()}, {healthy.url}")
+
+    assert _evaluate(client).score == 100
+    assert [endpoint.url for endpoint in client.endpoint_stats()][1] == healthy.url
+
+
+def test_raises_when_all_endpoints_fail(servers):
+    failing = servers(status=500)
+    client = Client(api_key="key", base_url=[_unused_url(), failing.url])
+
+    with pytest.raises(Exception, match="Qualifire API error: 500"):
+        _evaluate(client)
+
+    client = Client(api_key="key", base_url=[failing.url, _unused_url()])
+    with pytest.raises(requests.ConnectionError):
+        _evaluate(client)
+
+
+def test_unhealthy_endpoint_is_retried_after_cooldown(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    router = EndpointRouter(["a", "b"], failure_cooldown=10)
+    router.record_success("a", 0.01)
+    router.record_success("b", 0.5)
+    router.record_failure("a")
+
+    assert router.order() == ["b", "a"]
+    now[0] += 11
+    assert router.order() == ["a", "b"]
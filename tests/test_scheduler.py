@@ -0,0 +1,134 @@
+from typing import List
+
+import threading
+import time
+
+import pytest
+
+from qualifire.client import Client
+from qualifire.scheduler import RequestScheduler
+from qualifire.types import Priority
+
+
+def _run_in_slot(scheduler, priority, started, release):
+    with scheduler.slot(priority):
+        started.append(priority)
+        release.wait()
+
+
+def _start(scheduler, priority, started, release):
+    thread = threading.Thread(
+        target=_run_in_slot,
+        args=(scheduler, priority, started, release),
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def _wait_until(condition):
+    deadline = time.monotonic() + 2
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_background_cannot_use_reserved_slots():
+    scheduler = RequestScheduler(max_concurrency=2, reserved_realtime=1)
+    started: List[Priority] = []
+    release = threading.Event()
+
+    threads = [
+        _start(scheduler, Priority.BACKGROUND, started, release) for _ in range(2)
+    ]
+    _wait_until(lambda: scheduler.metrics()[Priority.BACKGROUND].queued == 1)
+    threads.append(_start(scheduler, Priority.REALTIME, started, release))
+    _wait_until(lambda: len(started) == 2)
+
+    metrics = scheduler.metrics()
+    assert metrics[Priority.REALTIME].in_flight == 1
+    assert metrics[Priority.BACKGROUND].in_flight == 1
+    assert metrics[Priority.BACKGROUND].queued == 1
+
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert scheduler.metrics()[Priority.BACKGROUND].completed == 2
+
+
+def test_realtime_jumps_ahead_of_queued_background():
+    scheduler = RequestScheduler(max_concurrency=1, reserved_realtime=0)
+    started: List[Priority] = []
+    release = threading.Event()
+
+    threads = [_start(scheduler, Priority.BACKGROUND, started, release)]
+    _wait_until(lambda: len(started) == 1)
+    threads.append(_start(scheduler, Priority.BACKGROUND, started, release))
+    _wait_until(lambda: scheduler.metrics()[Priority.BACKGROUND].queued == 1)
+    threads.append(_start(scheduler, Priority.REALTIME, started, release))
+    _wait_until(lambda: scheduler.metrics()[Priority.REALTIME].queued == 1)
+
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert started == [Priority.BACKGROUND, Priority.REALTIME, Priority.BACKGROUND]
+
+
+@pytest.mark.parametrize("attempt", range(20))
+def test_background_starts_on_free_slot_after_realtime_leaves_queue(attempt):
+    scheduler = RequestScheduler(max_concurrency=2, reserved_realtime=0)
+    started: List[Priority] = []
+    release_first, release_rest = threading.Event(), threading.Event()
+
+    threads = [
+        _start(scheduler, Priority.BACKGROUND, started, release_first) for _ in range(2)
+    ]
+    _wait_until(lambda: len(started) == 2)
+    threads.append(_start(scheduler, Priority.REALTIME, started, release_rest))
+    threads.append(_start(scheduler, Priority.BACKGROUND, started, release_rest))
+    _wait_until(lambda: sum(scheduler.metrics()[p].queued for p in Priority) == 2)
+
+    # both slots free up at once while the realtime request keeps running
+    release_first.set()
+    try:
+        _wait_until(lambda: len(started) == 4)
+    finally:
+        release_rest.set()
+    for thread in threads:
+        thread.join()
+    assert started[2] == Priority.REALTIME
+
+
+@pytest.mark.parametrize(
+    "max_concurrency,reserved_realtime",
+    [
+        (0, 0),
+        (2, 2),
+        (2, -1),
+    ],
+)
+def test_invalid_limits(max_concurrency, reserved_realtime):
+    with pytest.raises(ValueError):
+        RequestScheduler(max_concurrency, reserved_realtime)
+
+
+@pytest.mark.parametrize(
+    "max_concurrency,expected_reserved",
+    [
+        (1, 0),
+        (2, 1),
+        (8, 1),
+    ],
+)
+def test_client_default_reserved_realtime(max_concurrency, expected_reserved):
+    client = Client(api_key="key", max_concurrency=max_concurrency)
+    scheduler = client._scheduler
+
+    assert scheduler is not None
+    assert scheduler._reserved_realtime == expected_reserved
+
+
+def test_client_rejects_explicit_reserved_realtime_without_room():
+    with pytest.raises(ValueError):
+        Client(api_key="key", max_concurrency=1, reserved_realtime=1)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 import pytest
 
@@ -7,7 +7,7 @@ from qualifire.consts import (
     QUALIFIRE_API_KEY_ENV_VAR,
     QUALIFIRE_BASE_URL_ENV_VAR,
 )
-from qualifire.utils import get_api_key, get_base_url
+from qualifire.utils import get_api_key, get_base_url, get_base_urls
 
 
 @pytest.mark.parametrize(
@@ -54,3 +54,27 @@ def test_get_base_url(
         monkeypatch.delenv(QUALIFIRE_BASE_URL_ENV_VAR, False)
 
     assert get_base_url() == expected_result
+
+
+@pytest.mark.parametrize(
+    "env_value,expected_result",
+    [
+        ("https://a.example.com", ["https://a.example.com"]),
+        (
+            "https://a.example.com, https://b.example.com,",
+            ["https://a.example.com", "https://b.example.com"],
+        ),
+        (None, [_DEFAULT_BASE_URL]),
+    ],
+)
+def test_get_base_urls(
+    env_value: Optional[str],
+    expected_result: List[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    if env_value is not None:
+        monkeypatch.setenv(QUALIFIRE_BASE_URL_ENV_VAR, env_value)
+    else:
+        monkeypatch.delenv(QUALIFIRE_BASE_URL_ENV_VAR, False)
+
+    assert get_base_urls() == expected_result
@@ -0,0 +1,87 @@
+import pytest
+
+from qualifire.types import ConversationWindow, LLMMessage, LLMToolCall
+from qualifire.windowing import apply_conversation_window, estimate_tokens
+
+_conversation = [
+    LLMMessage(role="system", content="You are a weather assistant."),
+    LLMMessage(role="user", content="Weather in Paris?"),
+    LLMMessage(
+        role="assistant",
+        content="",
+        tool_calls=[
+            LLMToolCall(id="call_1", name="get_weather", arguments={"city": "Paris"}),
+        ],
+    ),
+    LLMMessage(role="tool", content="Sunny, 25C"),
+    LLMMessage(role="assistant", content="It is sunny in Paris."),
+    LLMMessage(role="user", content="And in London?"),
+    LLMMessage(
+        role="assistant",
+        content="",
+        tool_calls=[
+            LLMToolCall(id="call_2", name="get_weather", arguments={"city": "London"}),
+        ],
+    ),
+    LLMMessage(role="tool", content="Rainy, 15C"),
+    LLMMessage(role="assistant", content="It is rainy in London."),
+]
+
+
+@pytest.mark.parametrize(
+    "max_turns,expected",
+    [
+        (1, [0, 5, 6, 7, 8]),
+        (2, list(range(9))),
+        (5, list(range(9))),
+    ],
+)
+def test_max_turns(max_turns, expected):
+    window = ConversationWindow(max_turns=max_turns)
+
+    windowed = apply_conversation_window(_conversation, window)
+
+    assert windowed == [_conversation[i] for i in expected]
+
+
+def test_max_tokens_keeps_tool_results_with_their_call():
+    last_block = _conversation[6:8]
+    budget = (
+        estimate_tokens(_conversation[0])
+        + estimate_tokens(_conversation[8])
+        + sum(estimate_tokens(message) for message in last_block)
+    )
+    window = ConversationWindow(max_tokens=budget)
+
+    windowed = apply_conversation_window(_conversation, window)
+
+    assert windowed == [_conversation[0]] + _conversation[6:]
+
+
+def test_always_keeps_latest_message():
+    window = ConversationWindow(max_tokens=1, keep_system_prompt=False)
+
+    assert apply_conversation_window(_conversation, window) == _conversation[-1:]
+
+
+def test_works_on_dict_messages():
+    messages = [message.model_dump() for message in _conversation]
+    window = ConversationWindow(max_turns=1)
+
+    windowed = apply_conversation_window(messages, window)
+
+    assert windowed == [messages[i] for i in (0, 5, 6, 7, 8)]
+    assert windowed[0] is messages[0]
+
+
+@pytest.mark.parametrize(
+    "max_turns,max_tokens",
+    [
+        (None, None),
+        (0, None),
+        (None, 0),
+    ],
+)
+def test_invalid_window(max_turns, max_tokens):
+    with pytest.raises(ValueError):
+        ConversationWindow(max_turns=max_turns, max_tokens=max_tokens)